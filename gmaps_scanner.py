@@ -9,22 +9,37 @@
 from __future__ import annotations
 import argparse
 import csv
+import hashlib
 import json
+import os
+import re
+import socket
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 # optional imports will be checked at runtime
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except Exception:  # pragma: no cover - fail gracefully
     requests = None
 
+try:
+    import orjson
+except Exception:  # optional: faster JSON parsing, stdlib json is used otherwise
+    orjson = None
+
 try:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
+    from rich.text import Text
     from rich import box
 except Exception:  # pragma: no cover - fail gracefully
     Console = None
@@ -63,17 +78,185 @@ POST_PAYLOADS: Dict[str, Dict[str, Any]] = {
     "https://www.googleapis.com/geolocation/v1/geolocate?key={key}": {"considerIp": True},
 }
 
+# Image responses are classified from headers alone; only this many body bytes are read
+IMAGE_PEEK_BYTES = 4096
+# Error responses are classified from a short probe; other bodies are read up to a hard cap
+ERROR_PROBE_BYTES = 8192
+MAX_BODY_BYTES = 1024 * 1024
+
+# JSON keys whose presence in a 200 response means the API actually returned data
+_DATA_KEYS = frozenset({"results", "routes", "candidates", "snappedPoints", "locations", "place_id", "rows", "predictions"})
+
+# Body that opens a JSON object/array; only these are worth re-parsing when orjson rejects them
+_JSON_START_RE = re.compile(rb"\s*[\[{]")
+
+# Leading "<!doctype" / "<html" (after optional whitespace) marks an HTML page
+_HTML_RE = re.compile(r"\s*<(?:!doctype|html)", re.IGNORECASE)
+
+# Once a third of the scan has finished, a GET whose own request has been in flight for this many
+# seconds gets one duplicate ("hedged") request on an idle worker; the first answer wins.
+# Each duplicate is an extra billed call on the key, so hedging can be turned off (hedge=False /
+# --no-hedge); it is also off while --delay throttling is in effect, so it never exceeds the rate limit.
+HEDGE_DELAY = 1.0
+
 # Default user agent and request headers
 DEFAULT_HEADERS = {"User-Agent": "gmaps_scanner/1.0 (+https://example.local)"}
 
+# Connection pool sizing; each host gets its own session, so one pool per session is enough
+POOL_MAXSIZE = 10
+
+class ParsedApi(NamedTuple):
+    """An API_TESTS entry pre-split so a request URL is just url_prefix + key + url_suffix."""
+    name: str
+    method: str
+    host: str
+    url_prefix: str
+    url_suffix: str
+    payload: Optional[Dict[str, Any]]
+
+    def url(self, key: str) -> str:
+        return self.url_prefix + key + self.url_suffix
+
+def _parse_api(entry: Tuple[str, str, str]) -> ParsedApi:
+    """Parse an API_TESTS entry (friendly_name, method, url_template) into a ParsedApi."""
+    api_name, method, url_template = entry
+    url_prefix, placeholder, url_suffix = url_template.partition("{key}")
+    if not placeholder:
+        raise ValueError(f"URL template for {api_name!r} has no {{key}} placeholder")
+    return ParsedApi(api_name, method, urlsplit(url_template).netloc, url_prefix, url_suffix, POST_PAYLOADS.get(url_template))
+
+# API_TESTS parsed once at import: host for per-host sessions, split URL, payload looked up up front
+_API_TESTS_PARSED = [_parse_api(entry) for entry in API_TESTS]
+
+def _build_session(host: str, pool_maxsize: int = POOL_MAXSIZE) -> "requests.Session":
+    """Create a keep-alive session for one host whose connection pool is shared by all worker threads.
+
+    Proxy and CA-bundle environment settings are resolved once here rather than on every request.
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.proxies.update(requests.utils.get_environ_proxies(f"https://{host}"))
+    ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+    if ca_bundle:
+        session.verify = ca_bundle
+    session.trust_env = False
+    _mount_adapter(session, pool_maxsize)
+    return session
+
+def _retry_policy() -> "Retry":
+    """One quick retry of idempotent GETs that hit a transient gateway error.
+
+    Only the status forcelist triggers it: connect errors and read timeouts are raised straight
+    away, so a hung endpoint still costs a single --timeout.
+    """
+    kwargs = dict(total=1, connect=0, read=False, status=1, backoff_factor=0.2, status_forcelist=[502, 503, 504], allowed_methods=["GET"], raise_on_status=False)
+    try:
+        return Retry(backoff_jitter=0.1, **kwargs)
+    except TypeError:  # urllib3 < 2.0 has no jitter
+        return Retry(**kwargs)
+
+def _mount_adapter(session: "requests.Session", pool_maxsize: int):
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=_retry_policy())
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+_SESSIONS: Dict[str, "requests.Session"] = {}
+_SESSIONS_LOCK = threading.Lock()
+_pool_maxsize = POOL_MAXSIZE
+
+def _session_for(host: str) -> "requests.Session":
+    """Return the persistent session for a host, creating it on first use."""
+    session = _SESSIONS.get(host)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(host)
+            if session is None:
+                session = _SESSIONS[host] = _build_session(host, _pool_maxsize)
+    return session
+
+def _ensure_pool_size(concurrency: int):
+    """Size the per-host pools so every worker can hold its own kept-alive connection.
+
+    The size is fixed once the first session exists: swapping adapters on live sessions would
+    orphan their kept-alive sockets and race with requests in flight. A later, larger scan still
+    works; connections beyond the pool size are simply not kept alive.
+    """
+    global _pool_maxsize
+    with _SESSIONS_LOCK:
+        if not _SESSIONS:
+            _pool_maxsize = max(concurrency, POOL_MAXSIZE)
+
+# ----------------------------- DNS caching -----------------------------------
+# Every fresh connection resolves its host; the scan only talks to a handful of hosts,
+# so lookups are memoized for the lifetime of the process once the cache is installed.
+_DNS_CACHE: Dict[Tuple[Any, ...], Any] = {}
+_DNS_LOCK = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    cache_key = (host, port, family, type, proto, flags)
+    cached = _DNS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    res = _original_getaddrinfo(host, port, family, type, proto, flags)
+    with _DNS_LOCK:
+        _DNS_CACHE[cache_key] = res
+    return res
+
+def install_dns_cache():
+    """Route socket.getaddrinfo through the process-wide memoizing resolver."""
+    socket.getaddrinfo = _cached_getaddrinfo
+
+def _warm_dns(host: str):
+    # match the family urllib3 asks for so the warmed entry is the one it looks up
+    try:
+        from urllib3.util.connection import allowed_gai_family
+        family = allowed_gai_family()
+    except Exception:
+        family = socket.AF_UNSPEC
+    try:
+        socket.getaddrinfo(host, 443, family, socket.SOCK_STREAM)
+    except OSError:
+        pass  # the request itself will surface the resolution error
+
 # ----------------------------- Utility functions -----------------------------
-def safe_json(resp: "requests.Response") -> Optional[Dict[str, Any]]:
-    """Return JSON body or None if not parseable."""
+def safe_json(raw: bytes) -> Optional[Dict[str, Any]]:
+    """Return the JSON-decoded body or None if not parseable."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except Exception:
+            # stdlib json also accepts e.g. integers beyond 64 bits; anything else (HTML, empty
+            # bodies) is not JSON, so skip the second parse
+            if not _JSON_START_RE.match(raw):
+                return None
     try:
-        return resp.json()
+        return json.loads(raw)
     except Exception:
         return None
 
+def read_capped(resp: "requests.Response", limit: int) -> bytes:
+    """Read at most `limit` bytes of a streamed body.
+
+    A fully read body leaves the connection reusable; a truncated one is closed so the
+    remainder is never downloaded.
+    """
+    buf = bytearray()
+    # look one byte past the limit: a body of exactly `limit` bytes is complete, not truncated
+    for chunk in resp.iter_content(min(limit + 1, 65536)):
+        buf += chunk
+        if len(buf) > limit:
+            resp.close()
+            break
+    return bytes(buf[:limit])
+
+def decode_body(raw: bytes, encoding: Optional[str]) -> str:
+    """Decode a response body once, tolerating bad bytes and unknown charsets."""
+    try:
+        return raw.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return raw.decode("utf-8", errors="replace")
+
 def summarize_text_snippet(text: str, length: int = 300) -> str:
     text = text.strip().replace("\n", " ")
     if len(text) <= length:
@@ -86,15 +269,20 @@ def analyze_response(api_name: str, status: int, headers: Dict[str, Any], text:
     Labels: VULNERABLE, SECURE, UNDETERMINED
     """
     content_type = (headers.get("Content-Type") or "").lower()
+    api_name_lower = api_name.lower()
     # 200 OK cases
     if status == 200:
         if j:
             # heuristic: presence of expected result-like keys
-            if any(k in j for k in ("results", "routes", "candidates", "snappedPoints", "locations", "place_id", "rows", "predictions")):
+            if isinstance(j, dict) and not _DATA_KEYS.isdisjoint(j):
                 return "VULNERABLE", "200 OK with data-looking JSON"
             # geolocation returns location
-            if isinstance(j, dict) and ("location" in j or "location" in j.get("results", [{}])[0] if j.get("results") else False):
-                return "VULNERABLE", "200 OK with location data"
+            if isinstance(j, dict):
+                if "location" in j:
+                    return "VULNERABLE", "200 OK with location data"
+                results = j.get("results")
+                if isinstance(results, list) and results and isinstance(results[0], dict) and "location" in results[0]:
+                    return "VULNERABLE", "200 OK with location data"
             # JSON but error structure
             if "error" in j:
                 # often error inside 200: treat as SECURE
@@ -107,9 +295,9 @@ def analyze_response(api_name: str, status: int, headers: Dict[str, Any], text:
             return "UNDETERMINED", "200 OK with JSON body that lacks known data fields"
         else:
             # Non-JSON 200: could be image or HTML
-            if "image" in content_type or api_name.lower().startswith("staticmap") or "photo" in api_name.lower():
+            if "image" in content_type or api_name_lower.startswith("staticmap") or "photo" in api_name_lower:
                 return "UNDETERMINED", f"200 OK with image Content-Type: {content_type or 'unknown'}"
-            if text.strip().lower().startswith("<!doctype") or text.strip().lower().startswith("<html"):
+            if _HTML_RE.match(text):
                 return "SECURE", f"200 OK but returned HTML page (possibly gateway/redirect)"
             return "UNDETERMINED", "200 OK with non-JSON body"
     # Non-200 cases: inspect JSON error if present
@@ -126,11 +314,39 @@ def analyze_response(api_name: str, status: int, headers: Dict[str, Any], text:
     snippet = summarize_text_snippet(text, 300)
     return "SECURE", f"{status} {snippet or 'No response body'}"
 
+# Identical responses (e.g. the same 403 for many keys) are classified once.
+# Keyed on (api_name, status, Content-Type, encoding, body digest) -> (label, reason, snippet).
+CLASSIFY_CACHE_SIZE = 2048
+_CLASSIFY_CACHE: "OrderedDict[Tuple[Any, ...], Tuple[str, str, str]]" = OrderedDict()
+_CLASSIFY_LOCK = threading.Lock()
+
+def classify_body(api_name: str, status: int, headers: Dict[str, Any], raw: bytes, encoding: Optional[str]) -> Tuple[str, str, str]:
+    """Decode, parse and analyze a response body; returns (label, reason, snippet), memoized per distinct body."""
+    cache_key = (api_name, status, headers.get("Content-Type"), encoding, hashlib.blake2b(raw, digest_size=8).digest())
+    with _CLASSIFY_LOCK:
+        cached = _CLASSIFY_CACHE.get(cache_key)
+        if cached is not None:
+            _CLASSIFY_CACHE.move_to_end(cache_key)
+            return cached
+
+    # decode the body once; JSON is parsed straight from the raw bytes
+    resp_text = decode_body(raw, encoding)
+    resp_json = safe_json(raw)
+    label, reason = analyze_response(api_name, status, headers, resp_text, resp_json)
+    # include JSON summary or small body snippet for debug
+    snippet = resp_text[:500] if resp_json else summarize_text_snippet(resp_text, 500)
+
+    with _CLASSIFY_LOCK:
+        _CLASSIFY_CACHE[cache_key] = (label, reason, snippet)
+        if len(_CLASSIFY_CACHE) > CLASSIFY_CACHE_SIZE:
+            _CLASSIFY_CACHE.popitem(last=False)
+    return label, reason, snippet
+
 # ----------------------------- Network worker --------------------------------
-def test_one(api_name: str, method: str, url_template: str, key: str, timeout: int = 8) -> Dict[str, Any]:
-    """Perform a single API test and return a structured result."""
-    url = url_template.format(key=key)
-    body = POST_PAYLOADS.get(url_template)
+def test_one(api: ParsedApi, key: str, timeout: int = 8) -> Dict[str, Any]:
+    """Perform a single API test (a parsed API_TESTS entry) and return a structured result."""
+    api_name, method, host, body = api.name, api.method, api.host, api.payload
+    url = api.url(key)
     result = {
         "api": api_name,
         "method": method,
@@ -145,28 +361,29 @@ def test_one(api_name: str, method: str, url_template: str, key: str, timeout: i
         result.update({"label": "UNDETERMINED", "reason": "requests library not installed"})
         return result
 
-    headers = DEFAULT_HEADERS.copy()
+    # headers, proxies and TLS settings live on the per-host session
+    session = _session_for(host)
     try:
         if method.upper() == "GET":
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            resp = session.get(url, timeout=timeout, stream=True)
         else:
-            resp = requests.post(url, json=body, headers=headers, timeout=timeout)
+            resp = session.post(url, json=body, timeout=timeout, stream=True)
+        content_type = resp.headers.get("Content-Type") or ""
+        if content_type.lower().startswith("image/"):
+            # images are never inspected: peek at the first bytes and drop the rest of the download
+            peeked = read_capped(resp, IMAGE_PEEK_BYTES)
+            raw = None
+        else:
+            raw = read_capped(resp, MAX_BODY_BYTES if resp.status_code == 200 else ERROR_PROBE_BYTES)
     except requests.RequestException as e:
         result.update({"label": "UNDETERMINED", "reason": f"Request failed: {e}"})
         return result
 
-    resp_text = resp.text or ""
-    resp_json = safe_json(resp)
-    label, reason = analyze_response(api_name, resp.status_code, resp.headers, resp_text, resp_json)
-    snippet = None
-    # include JSON summary or small body snippet for debug
-    if resp_json:
-        try:
-            snippet = json.dumps(resp_json if isinstance(resp_json, dict) else {"value": resp_json})[:500]
-        except Exception:
-            snippet = summarize_text_snippet(str(resp_json), 300)
+    if raw is None:
+        label, reason = analyze_response(api_name, resp.status_code, resp.headers, "", None)
+        snippet = f"[{content_type} body, first {len(peeked)} bytes read]"
     else:
-        snippet = summarize_text_snippet(resp_text, 500)
+        label, reason, snippet = classify_body(api_name, resp.status_code, resp.headers, raw, resp.encoding)
 
     result.update({
         "http_status": resp.status_code,
@@ -177,46 +394,149 @@ def test_one(api_name: str, method: str, url_template: str, key: str, timeout: i
     return result
 
 # ----------------------------- Scanning coordinator ---------------------------
-def scan_all(key: str, concurrency: int = 10, timeout: int = 8, delay: float = 0.0, apis = None) -> List[Dict[str, Any]]:
+class _HostThrottle:
+    """Spaces out request start times by `delay` seconds per host, shared across worker threads."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, host: str):
+        # reserve the next free slot for this host under the lock, then sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+def _test_one_safe(api: ParsedApi, key: str, timeout: int, throttle: Optional[_HostThrottle] = None) -> Dict[str, Any]:
+    """test_one, but any unexpected exception becomes an UNDETERMINED result instead of propagating."""
+    try:
+        if throttle is not None:
+            throttle.wait(api.host)
+        return test_one(api, key, timeout)
+    except Exception as e:
+        return {
+            "api": api.name,
+            "method": api.method,
+            "url": api.url(key),
+            "http_status": None,
+            "label": "UNDETERMINED",
+            "reason": f"Exception in worker: {e}",
+            "response_snippet": None,
+        }
+
+def _run_hedged(exe: ThreadPoolExecutor, workers: int, fn, tasks: List[Any], can_hedge) -> List[Any]:
+    """Run fn over tasks on exe, duplicating straggling tasks once, and return results in task order."""
+    results: List[Any] = [None] * len(tasks)
+    started: Dict[int, float] = {}  # when each task's first attempt began running
+    busy = [0]  # worker threads currently inside fn, including losing duplicates
+    lock = threading.Lock()
+
+    def attempt(i: int):
+        with lock:
+            started.setdefault(i, time.monotonic())
+            busy[0] += 1
+        try:
+            return fn(tasks[i])
+        finally:
+            with lock:
+                busy[0] -= 1
+
+    pending = {exe.submit(attempt, i): i for i in range(len(tasks))}
+    hedged = set()
+    finished = 0
+    while pending:
+        done, _ = wait(pending, timeout=HEDGE_DELAY / 4, return_when=FIRST_COMPLETED)
+        for fut in done:
+            # a twin that finished in the same window was already dropped below
+            i = pending.pop(fut, None)
+            if i is None:
+                continue
+            if results[i] is None:
+                results[i] = fut.result()
+                finished += 1
+                # forget the losing twin, if any; it is cancelled if it has not started yet
+                for other in [f for f, j in pending.items() if j == i]:
+                    other.cancel()
+                    del pending[other]
+        if finished * 3 < len(tasks):
+            continue
+        now = time.monotonic()
+        with lock:
+            idle = workers - busy[0]
+            stragglers = [i for i in set(pending.values()) if i in started and now - started[i] >= HEDGE_DELAY]
+        for i in stragglers:
+            if idle <= 0:
+                break
+            if i not in hedged and can_hedge(tasks[i]):
+                hedged.add(i)
+                pending[exe.submit(attempt, i)] = i
+                idle -= 1
+    return results
+
+def scan_all(key: str, concurrency: int = 10, timeout: int = 8, delay: float = 0.0, apis = None, hedge: bool = True) -> List[Dict[str, Any]]:
     """Run tests for all APIs concurrently and return the list of results in the same order as API_TESTS."""
-    apis = apis if apis is not None else API_TESTS
-    results_by_index: Dict[int, Dict[str, Any]] = {}
-    tasks = []
-    with ThreadPoolExecutor(max_workers=max(2, concurrency)) as exe:
-        futures = {}
-        for idx, (api_name, method, url_template) in enumerate(apis):
-            futures[exe.submit(test_one, api_name, method, url_template, key, timeout)] = idx
-            if delay and delay > 0:
-                time.sleep(delay)
-        # collect
-        for fut in as_completed(futures):
-            idx = futures[fut]
-            try:
-                res = fut.result()
-            except Exception as e:
-                res = {
-                    "api": apis[idx][0],
-                    "method": apis[idx][1],
-                    "url": apis[idx][2].format(key=key),
-                    "http_status": None,
-                    "label": "UNDETERMINED",
-                    "reason": f"Exception in worker: {e}",
-                    "response_snippet": None,
-                }
-            results_by_index[idx] = res
-    # Reorder to original order
-    return [results_by_index[i] for i in range(len(apis))]
+    return scan_many([key], concurrency=concurrency, timeout=timeout, delay=delay, apis=apis, hedge=hedge)[key]
+
+def scan_many(keys: List[str], concurrency: int = 10, timeout: int = 8, delay: float = 0.0, apis = None, hedge: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+    """Scan several keys through one worker pool and the shared per-host sessions.
+
+    Returns {key: results}, each list in API_TESTS order (duplicate keys are scanned once).
+    """
+    keys = list(dict.fromkeys(keys))
+    apis = [_parse_api(entry) for entry in apis] if apis is not None else _API_TESTS_PARSED
+    if requests is not None:
+        _ensure_pool_size(concurrency)
+    tasks = [(key, api) for key in keys for api in apis]
+    if not tasks:
+        return {key: [] for key in keys}
+    # never start more threads than there are requests to make
+    workers = max(1, min(max(2, concurrency), len(tasks)))
+    # throttling happens in the workers, per host, so scheduling never blocks on it
+    throttle = _HostThrottle(delay) if delay and delay > 0 else None
+
+    exe = ThreadPoolExecutor(max_workers=workers)
+    try:
+        if socket.getaddrinfo is _cached_getaddrinfo:
+            # resolve each distinct host once, up front, instead of once per cold connection
+            hosts = {urlsplit("//" + api.host).hostname for api in apis}
+            list(exe.map(_warm_dns, hosts))
+        def run(task: Tuple[str, ParsedApi]) -> Dict[str, Any]:
+            key, api = task
+            return _test_one_safe(api, key, timeout, throttle)
+
+        def can_hedge(task: Tuple[str, ParsedApi]) -> bool:
+            _, api = task
+            return api.method.upper() == "GET"
+
+        if hedge and throttle is None:
+            results = _run_hedged(exe, workers, run, tasks, can_hedge=can_hedge)
+        else:
+            results = list(exe.map(run, tasks))
+    finally:
+        # return without waiting for a duplicate that lost the race; it still runs to completion
+        # (at most --timeout), and the interpreter joins it before the process exits
+        exe.shutdown(wait=False, cancel_futures=True)
+    n = len(apis)
+    return {key: results[i * n:(i + 1) * n] for i, key in enumerate(keys)}
 
 # ----------------------------- Output helpers --------------------------------
-def print_results_table(results: List[Dict[str, Any]]):
-    """Print the results using rich.Table; falls back to plain text if rich is unavailable."""
-    if Console is None:
-        # plain text fallback
-        for r in results:
-            print(f"{r['api']:<30} | {r['label']:<12} | {r['http_status']!s:<4} | {r['reason']}")
-        return
+_STATUS_STYLES = {"VULNERABLE": "bold red", "SECURE": "green", "UNDETERMINED": "yellow"}
 
-    console = Console()
+def _print_plain(results: List[Dict[str, Any]]):
+    for r in results:
+        print(f"{r['api']:<30} | {r['label']:<12} | {r['http_status']!s:<4} | {r['reason']}")
+    print(f"Vulnerable APIs found: {sum(1 for r in results if r.get('label') == 'VULNERABLE')}")
+
+def print_results_table(results: List[Dict[str, Any]], no_color: bool = False):
+    """Print the results using rich.Table; falls back to plain text if rich is unavailable or stdout is not a terminal."""
+    if Console is None or not sys.stdout.isatty():
+        return _print_plain(results)
+
+    console = Console(no_color=no_color)
     table = Table(title="Google Maps API Vulnerability Report", box=box.MINIMAL_DOUBLE_HEAD, show_lines=False)
     table.add_column("API", style="bold cyan", no_wrap=True)
     table.add_column("Status", style="bold")
@@ -226,40 +546,50 @@ def print_results_table(results: List[Dict[str, Any]]):
     vulnerables = 0
     for r in results:
         lbl = r.get("label", "UNDETERMINED")
+        if lbl not in _STATUS_STYLES:
+            lbl = "UNDETERMINED"
         if lbl == "VULNERABLE":
-            status = "[bold red]VULNERABLE[/bold red]"
             vulnerables += 1
-        elif lbl == "SECURE":
-            status = "[green]SECURE[/green]"
-        else:
-            status = "[yellow]UNDETERMINED[/yellow]"
-        table.add_row(r["api"], status, str(r.get("http_status", "")), r.get("reason", ""))
+        # Text cells skip the markup parser (and keep brackets in server messages literal)
+        table.add_row(r["api"], Text(lbl, style=_STATUS_STYLES[lbl]), str(r.get("http_status", "")), Text(r.get("reason", "")))
     console.print(table)
     console.print(Panel(f"Vulnerable APIs found: [bold red]{vulnerables}[/bold red]", title="Summary"))
 
-def save_json(results: List[Dict[str, Any]], path: str):
+CSV_FIELDS = ["api", "method", "url", "http_status", "label", "reason", "response_snippet"]
+
+def save_json(results: Union[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]]], path: str, pretty: bool = False):
+    # compact separators unless a human-readable file was asked for
     with open(path, "w", encoding="utf-8") as fh:
-        json.dump(results, fh, ensure_ascii=False, indent=2)
+        if pretty:
+            json.dump(results, fh, ensure_ascii=False, indent=2)
+        else:
+            json.dump(results, fh, ensure_ascii=False, separators=(",", ":"))
 
-def save_csv(results: List[Dict[str, Any]], path: str):
-    keys = ["api", "method", "url", "http_status", "label", "reason", "response_snippet"]
+def save_csv(results: List[Dict[str, Any]], path: str, fields: List[str] = CSV_FIELDS):
     with open(path, "w", encoding="utf-8", newline="") as fh:
-        w = csv.DictWriter(fh, fieldnames=keys)
-        w.writeheader()
-        for r in results:
-            w.writerow({k: r.get(k, "") for k in keys})
+        w = csv.writer(fh)
+        w.writerow(fields)
+        w.writerows([[r.get(k, "") for k in fields] for r in results])
+
+def read_keys_file(path: str) -> List[str]:
+    """Read one API key per line, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as fh:
+        return [line.strip() for line in fh if line.strip() and not line.lstrip().startswith("#")]
 
 # ----------------------------- CLI / Main ------------------------------------
 def parse_args():
     p = argparse.ArgumentParser(prog="gmaps_scanner.py", description="Google Maps API key scanner (single-file). Only run against keys you own or have permission to test.")
     p.add_argument("--key", "-k", help="Google Maps API key to test")
+    p.add_argument("--keys-file", type=str, help="File with one API key per line; all keys are scanned in one batch")
     p.add_argument("--demo", action="store_true", help="Run demo mode (no network calls)")
     p.add_argument("--concurrency", "-c", type=int, default=10, help="Number of concurrent workers (default: 10)")
     p.add_argument("--timeout", type=int, default=8, help="HTTP timeout seconds (default: 8)")
-    p.add_argument("--delay", type=float, default=0.0, help="Delay in seconds between scheduling requests (throttling)")
+    p.add_argument("--delay", type=float, default=0.0, help="Minimum delay in seconds between requests to the same host (throttling)")
+    p.add_argument("--no-hedge", action="store_true", help="Never send a duplicate request for a slow GET (each duplicate is an extra billed call)")
     p.add_argument("--output-json", type=str, help="Save results to JSON file")
     p.add_argument("--output-csv", type=str, help="Save results to CSV file")
-    p.add_argument("--no-color", action="store_true", help="Disable rich colors (if Console installed will still be used)")
+    p.add_argument("--pretty", action="store_true", help="Indent the JSON output instead of writing it compactly")
+    p.add_argument("--no-color", action="store_true", help="Disable rich colors (the table layout is still used on a terminal)")
     return p.parse_args()
 
 def demo_results() -> List[Dict[str, Any]]:
@@ -285,36 +615,72 @@ def main():
 
     if args.demo:
         results = demo_results()
-        print_results_table(results)
+        print_results_table(results, no_color=args.no_color)
         if args.output_json:
-            save_json(results, args.output_json)
+            save_json(results, args.output_json, pretty=args.pretty)
             print(f"Saved demo JSON to {args.output_json}")
         if args.output_csv:
             save_csv(results, args.output_csv)
             print(f"Saved demo CSV to {args.output_csv}")
         return
 
-    if not args.key:
-        print("Missing required --key argument. Use --key YOUR_API_KEY or run with --demo.")
+    if not args.key and not args.keys_file:
+        print("Missing required --key argument. Use --key YOUR_API_KEY, --keys-file FILE or run with --demo.")
         sys.exit(1)
 
+    if args.keys_file:
+        scan_batch(args)
+        return
+
     # perform scan
+    install_dns_cache()
     start = time.time()
-    results = scan_all(key=args.key, concurrency=args.concurrency, timeout=args.timeout, delay=args.delay)
+    results = scan_all(key=args.key, concurrency=args.concurrency, timeout=args.timeout, delay=args.delay, hedge=not args.no_hedge)
     elapsed = time.time() - start
 
     # output
-    print_results_table(results)
+    print_results_table(results, no_color=args.no_color)
     print(f"Scan completed in {elapsed:.2f} seconds.")
 
     # exports
     if args.output_json:
-        save_json(results, args.output_json)
+        save_json(results, args.output_json, pretty=args.pretty)
         print(f"Saved JSON output to {args.output_json}")
     if args.output_csv:
         save_csv(results, args.output_csv)
         print(f"Saved CSV output to {args.output_csv}")
 
+def scan_batch(args):
+    """--keys-file mode: scan every key in one batch; exports are keyed by API key."""
+    try:
+        keys = read_keys_file(args.keys_file)
+    except OSError as e:
+        print(f"Could not read keys file {args.keys_file}: {e}")
+        sys.exit(1)
+    if args.key:
+        keys.insert(0, args.key)
+    if not keys:
+        print(f"No keys found in {args.keys_file}.")
+        sys.exit(1)
+
+    install_dns_cache()
+    start = time.time()
+    results_by_key = scan_many(keys, concurrency=args.concurrency, timeout=args.timeout, delay=args.delay, hedge=not args.no_hedge)
+    elapsed = time.time() - start
+
+    for key, results in results_by_key.items():
+        print(f"\nKey: {key}")
+        print_results_table(results, no_color=args.no_color)
+    print(f"Scanned {len(results_by_key)} keys in {elapsed:.2f} seconds.")
+
+    if args.output_json:
+        save_json(results_by_key, args.output_json, pretty=args.pretty)
+        print(f"Saved JSON output to {args.output_json}")
+    if args.output_csv:
+        rows = [{"key": key, **r} for key, results in results_by_key.items() for r in results]
+        save_csv(rows, args.output_csv, fields=["key"] + CSV_FIELDS)
+        print(f"Saved CSV output to {args.output_csv}")
+
 if __name__ == "__main__":
     main()
 
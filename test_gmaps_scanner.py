@@ -0,0 +1,63 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import gmaps_scanner
+
+
+def test_run_hedged_twins_finishing_in_same_window(monkeypatch):
+    """A straggler and its hedged duplicate completing together must not crash the scan."""
+    monkeypatch.setattr(gmaps_scanner, "HEDGE_DELAY", 0.05)
+    real_wait = gmaps_scanner.wait
+
+    def slow_wait(*args, **kwargs):
+        # give both twins time to finish before wait() reports them together
+        time.sleep(0.1)
+        return real_wait(*args, **kwargs)
+
+    monkeypatch.setattr(gmaps_scanner, "wait", slow_wait)
+
+    release = threading.Event()
+    calls = Counter()
+    lock = threading.Lock()
+
+    def fn(task):
+        with lock:
+            calls[task] += 1
+            attempt = calls[task]
+        if task == "slow":
+            if attempt == 1:
+                release.wait(5)  # the original hangs until its duplicate runs
+            else:
+                release.set()
+        return {"task": task}
+
+    tasks = ["a", "b", "c", "slow"]
+    with ThreadPoolExecutor(max_workers=4) as exe:
+        results = gmaps_scanner._run_hedged(exe, 4, fn, tasks, can_hedge=lambda task: True)
+
+    assert [r["task"] for r in results] == tasks
+    assert calls["slow"] == 2
+
+
+def test_scan_all_without_hedging_sends_each_request_once(monkeypatch):
+    monkeypatch.setattr(gmaps_scanner, "HEDGE_DELAY", 0.05)
+    calls = Counter()
+    lock = threading.Lock()
+
+    def fake_test_one(api, key, timeout=8):
+        with lock:
+            calls[api.name] += 1
+        if api.name == "Slow":
+            time.sleep(0.5)
+        return {"api": api.name, "label": "SECURE"}
+
+    monkeypatch.setattr(gmaps_scanner, "test_one", fake_test_one)
+    apis = [(f"Fast {i}", "GET", "https://example.invalid/fast?key={key}") for i in range(3)]
+    apis.append(("Slow", "GET", "https://example.invalid/slow?key={key}"))
+
+    results = gmaps_scanner.scan_all("KEY", concurrency=4, apis=apis, hedge=False)
+
+    assert [r["api"] for r in results] == [name for name, _, _ in apis]
+    assert calls["Slow"] == 1